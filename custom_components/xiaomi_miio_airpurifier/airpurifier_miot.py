@@ -1,5 +1,7 @@
 import enum
 import logging
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 import click
@@ -10,38 +12,53 @@ from miio.exceptions import DeviceException
 from miio.miot_device import DeviceStatus, MiotDevice
 
 # https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:air-purifier:0000A007:zhimi-za1:1
-_MODEL_AIRPURIFIER_ZA1 = {
-    # Air Purifier
-    "power": {"siid": 2, "piid": 1},
-    "mode": {"siid": 2, "piid": 5},
-    # Environment
-    "tvoc": {"siid": 3, "piid": 1},
-    "pm25": {"siid": 3, "piid": 6},
-    "humidity": {"siid": 3, "piid": 7},
-    "temperature": {"siid": 3, "piid": 8},
-    # Filter
-    "filter_life_remaining": {"siid": 4, "piid": 3},
-    "filter_hours_used": {"siid": 4, "piid": 5},
-    # Alarm
-    "buzzer": {"siid": 5, "piid": 1},
-    # Screen
-    "led_brightness": {"siid": 6, "piid": 1},
-    # Physical Control Locked
-    "child_lock": {"siid": 7, "piid": 1},
-    # Motor Speed (siid=10)
-    "favorite_level": {"siid": 10, "piid": 10},
-    "motor_speed": {"siid": 10, "piid": 11},
-    # Use time (siid=12)
-    "use_time": {"siid": 12, "piid": 1},
-    # AQI (siid=13)
-    "purify_volume": {"siid": 13, "piid": 1},
-    "average_aqi": {"siid": 13, "piid": 2},
-    # RFID (siid=14)
-    "filter_rfid_tag": {"siid": 14, "piid": 1},
-    "filter_rfid_product_id": {"siid": 14, "piid": 3},
-    # custom-service
-    "gesture_status": {"siid": 15, "piid": 13}
-}
+_MODEL_AIRPURIFIER_ZA1 = MappingProxyType(
+    {
+        # Air Purifier
+        "power": {"siid": 2, "piid": 1},
+        "mode": {"siid": 2, "piid": 5},
+        # Environment
+        "tvoc": {"siid": 3, "piid": 1},
+        "pm25": {"siid": 3, "piid": 6},
+        "humidity": {"siid": 3, "piid": 7},
+        "temperature": {"siid": 3, "piid": 8},
+        # Filter
+        "filter_life_remaining": {"siid": 4, "piid": 3},
+        "filter_hours_used": {"siid": 4, "piid": 5},
+        # Alarm
+        "buzzer": {"siid": 5, "piid": 1},
+        # Screen
+        "led_brightness": {"siid": 6, "piid": 1},
+        # Physical Control Locked
+        "child_lock": {"siid": 7, "piid": 1},
+        # Motor Speed (siid=10)
+        "favorite_level": {"siid": 10, "piid": 10},
+        "motor_speed": {"siid": 10, "piid": 11},
+        # Use time (siid=12)
+        "use_time": {"siid": 12, "piid": 1},
+        # AQI (siid=13)
+        "purify_volume": {"siid": 13, "piid": 1},
+        "average_aqi": {"siid": 13, "piid": 2},
+        # RFID (siid=14)
+        "filter_rfid_tag": {"siid": 14, "piid": 1},
+        "filter_rfid_product_id": {"siid": 14, "piid": 3},
+        # custom-service
+        "gesture_status": {"siid": 15, "piid": 13}
+    }
+)
+
+# Sensor readings which go stale while the device is powered off
+_ZA1_VOLATILE_PROPERTIES = (
+    "tvoc",
+    "pm25",
+    "humidity",
+    "temperature",
+    "motor_speed",
+    "average_aqi",
+)
+
+# Error rows (code != 0) usually carry no "value", so it is only read on success
+_PROP_FIELDS = itemgetter("did", "code")
 
 
 class AirPurifierMiotException(DeviceException):
@@ -61,6 +78,29 @@ class LedBrightness(enum.Enum):
     Off = 2
 
 
+_MODE_BY_VALUE = {mode.value: mode for mode in OperationMode}
+_LED_BY_VALUE = {brightness.value: brightness for brightness in LedBrightness}
+
+
+def _check_favorite_rpm(rpm: int) -> None:
+    # Note: documentation says the maximum is 2300, however, the purifier may return an error for rpm over 2200.
+    if rpm < 300 or rpm > 2300 or rpm % 10 != 0:
+        raise AirPurifierMiotException(
+            "Invalid favorite motor speed: %s. Must be between 300 and 2300 and divisible by 10"
+            % rpm
+        )
+
+
+def _check_favorite_level(level: int) -> None:
+    if level < 0 or level > 14:
+        raise AirPurifierMiotException("Invalid favorite level: %s" % level)
+
+
+_PROPERTY_CHECKS = {
+    "favorite_level": _check_favorite_level,
+}
+
+
 class BasicAirPurifierMiotStatus(DeviceStatus):
     """Container for status reports from the air purifier."""
 
@@ -86,15 +126,16 @@ class BasicAirPurifierMiotStatus(DeviceStatus):
     @property
     def mode(self) -> OperationMode:
         """Current operation mode."""
-        return OperationMode(self.data["mode"])
+        mode = _MODE_BY_VALUE.get(self.data["mode"])
+        if mode is None:
+            raise ValueError("%r is not a valid OperationMode" % self.data["mode"])
+
+        return mode
 
     @property
     def buzzer(self) -> Optional[bool]:
         """Return True if buzzer is on."""
-        if self.data["buzzer"] is not None:
-            return self.data["buzzer"]
-
-        return None
+        return self.data["buzzer"]
 
     @property
     def child_lock(self) -> bool:
@@ -167,10 +208,8 @@ class AirPurifierZA1Status(BasicAirPurifierMiotStatus):
     @property
     def temperature(self) -> Optional[float]:
         """Current temperature, if available."""
-        if self.data["temperature"] is not None:
-            return round(self.data["temperature"], 1)
-
-        return None
+        temperature = self.data["temperature"]
+        return round(temperature, 1) if temperature is not None else None
 
     # @property
     # def fan_level(self) -> int:
@@ -185,13 +224,7 @@ class AirPurifierZA1Status(BasicAirPurifierMiotStatus):
     @property
     def led_brightness(self) -> Optional[LedBrightness]:
         """Brightness of the LED."""
-        if self.data["led_brightness"] is not None:
-            try:
-                return LedBrightness(self.data["led_brightness"])
-            except ValueError:
-                return None
-
-        return None
+        return _LED_BY_VALUE.get(self.data["led_brightness"])
 
     # @property
     # def buzzer_volume(self) -> Optional[int]:
@@ -262,12 +295,7 @@ class BasicAirPurifierMiot(MiotDevice):
     )
     def set_favorite_rpm(self, rpm: int):
         """Set favorite motor speed."""
-        # Note: documentation says the maximum is 2300, however, the purifier may return an error for rpm over 2200.
-        if rpm < 300 or rpm > 2300 or rpm % 10 != 0:
-            raise AirPurifierMiotException(
-                "Invalid favorite motor speed: %s. Must be between 300 and 2300 and divisible by 10"
-                % rpm
-            )
+        _check_favorite_rpm(rpm)
         return self.set_property("favorite_rpm", rpm)
 
     @command(
@@ -298,6 +326,25 @@ class BasicAirPurifierMiot(MiotDevice):
         """Set child lock on/off."""
         return self.set_property("child_lock", lock)
 
+    def set_multiple(self, **properties):
+        """Set several mapped properties using a single request.
+
+        Enum members are converted to their values, e.g. ``mode=OperationMode.Favorite``.
+        """
+        mapping = self._get_mapping()
+        payload = []
+        for key, value in properties.items():
+            if key not in mapping:
+                raise AirPurifierMiotException("Unsupported property: %s" % key)
+            if isinstance(value, enum.Enum):
+                value = value.value
+            if key in _PROPERTY_CHECKS:
+                _PROPERTY_CHECKS[key](value)
+            payload.append({"did": key, **mapping[key], "value": value})
+
+        return self.send("set_properties", payload)
+
+
 class AirPurifierZA1(BasicAirPurifierMiot):
     """Main class representing the air purifier which uses MIoT protocol."""
 
@@ -321,12 +368,41 @@ class AirPurifierZA1(BasicAirPurifierMiot):
     )
     def status(self) -> AirPurifierZA1Status:
         """Retrieve properties."""
-        return AirPurifierZA1Status(
-            {
-                prop["did"]: prop["value"] if prop["code"] == 0 else None
-                for prop in self.get_properties_for_mapping()
-            }
+        mapping = self._get_mapping()
+        data = dict.fromkeys(mapping)
+        data.update(
+            self._get_mapped_properties(
+                mapping,
+                [key for key in mapping if key not in _ZA1_VOLATILE_PROPERTIES],
+            )
+        )
+
+        # Environment and motor readings are stale while the device is off.
+        # A failed power read (None) still fetches them.
+        if data["power"] is not False:
+            data.update(
+                self._get_mapped_properties(mapping, _ZA1_VOLATILE_PROPERTIES)
+            )
+
+        return AirPurifierZA1Status(data)
+
+    def _get_mapped_properties(
+        self, mapping, keys, *, max_properties=15
+    ) -> Dict[str, Any]:
+        """Retrieve a subset of the mapped properties, like get_properties_for_mapping."""
+        props = self.get_properties(
+            [
+                {"did": key, **mapping[key]}
+                for key in keys
+                if "aiid" not in mapping[key]
+            ],
+            property_getter="get_properties",
+            max_properties=max_properties,
         )
+        return {
+            did: prop["value"] if code == 0 else None
+            for prop, (did, code) in zip(props, map(_PROP_FIELDS, props))
+        }
 
     @command(
         click.argument("gesture", type=bool),
@@ -346,8 +422,7 @@ class AirPurifierZA1(BasicAirPurifierMiot):
         """Set the favorite level used when the mode is `favorite`.
         Needs to be between 0 and 14.
         """
-        if level < 0 or level > 14:
-            raise AirPurifierMiotException("Invalid favorite level: %s" % level)
+        _check_favorite_level(level)
         return self.set_property("favorite_level", level)
 
     @command(